@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Dict
+from uuid import uuid4
+from collections import defaultdict
+import itertools
+
+class GymError(Exception):
+    """Base Error for gym domain"""
+
+class ValidationError(GymError):
+    """Raised when states are invalid"""
+
+class NotFoundError(GymError):
+    """Raised when an entity cannot be found"""
+
+class PaymentError(GymError):
+    """"Raised for payment related failures"""
+
+class MembershipStatus(str, Enum):
+    ACTIVE = "active"
+    PAUSED = "paused"
+    CANCELLED = "cancelled"
+
+class PaymentStatus(str, Enum):
+    SUCCESS = "success"
+    FAILED = "failed"
+
+_PROCESS_TAG = uuid4().hex[:12]
+_COUNTERS: Dict[str, itertools.count] = defaultdict(lambda: itertools.count(1))
+
+def new_id(prefix: str) -> str:
+    if not prefix or not prefix.strip():
+        raise ValidationError ("Prefix must be a non empty string.")
+    return f"{prefix}_{_PROCESS_TAG}{next(_COUNTERS[prefix]):x}"
@@ -1,72 +1,65 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
+
+from gym.core import GymError, ValidationError, NotFoundError, PaymentError, MembershipStatus, PaymentStatus, new_id
 from gym.people import Member, Trainer
 from gym.payments import BasePaymentProcessor, FakePaymentProcessor, InMemoryPaymentLedger, PaymentRecord
 from gym.workouts import WorkoutCatalog, WorkoutPlan, Exercise
 
-from enum import Enum
-from uuid import uuid4
-
-class GymError(Exception):
-    """Base Error for gym domain"""
-
-class ValidationError(GymError):
-    """Raised when states are invalid"""
-
-class NotFoundError(GymError):
-    """Raised when an entity cannot be found"""
-
-class PaymentError(GymError):
-    """"Raised for payment related failures"""
-
-class MembershipStatus(str, Enum):
-    ACTIVE = "active"
-    PAUSED = "paused"
-    CANCELLED = "cancelled"
-
-class PaymentStatus(str, Enum):
-    SUCCESS = "success"
-    FAILED = "failed"
+_CANCELLED = MembershipStatus.CANCELLED
 
-def new_id(prefix: str) -> str:
-    if not prefix or not prefix.strip():
-        raise ValidationError ("Prefix must be a non empty string.")
-    return f"{prefix}_{uuid4().hex}"
-
-@dataclass
+@dataclass(slots=True)
 class Gym():
     name: str
     members: Dict[str, Member] = field(default_factory=dict)
     trainers: Dict[str, Trainer] = field(default_factory=dict)
-    members_by_email: Dict[str,str] = field(default_factory=dict)
-    trainers_by_email: Dict[str,str] = field(default_factory=dict)
+    members_by_email: Optional[Dict[str,str]] = None
+    trainers_by_email: Optional[Dict[str,str]] = None
     payment_processor: BasePaymentProcessor = field(default_factory=FakePaymentProcessor)
     payment_ledger: InMemoryPaymentLedger = field(default_factory=InMemoryPaymentLedger)
     workouts: WorkoutCatalog = field(default_factory=WorkoutCatalog)
 
+    _summary_cache: Optional[str] = field(init=False, default=None, repr=False)
+    _active_members: Set[str] = field(init=False, default_factory=set, repr=False)
+
     def __post_init__(self) -> None:
         if not self.name or not self.name.strip():
             raise ValidationError ("Gym name cannot be empty")
+
+    def _invalidate_summary(self) -> None:
+        self._summary_cache = None
+
+    def _member_email_index(self) -> Dict[str, str]:
+        if self.members_by_email is None:
+            self.members_by_email = {m.email_key: m.id for m in self.members.values()}
+        return self.members_by_email
+
+    def _trainer_email_index(self) -> Dict[str, str]:
+        if self.trainers_by_email is None:
+            self.trainers_by_email = {t.email_key: t.id for t in self.trainers.values()}
+        return self.trainers_by_email
         
     def add_member(self, member: Member) -> None:
-        if not isinstance(member,Member):
+        if __debug__ and not isinstance(member,Member):
             raise ValidationError ("Must be a member object.")
         
-        if member.membership.status == MembershipStatus.CANCELLED:
+        if member.membership.status == _CANCELLED:
             raise ValidationError ("Cannot add a member with cancelled status.")
         
         if member.id in self.members:
             raise ValidationError ("This member already exists in the system.")
         
-        email_key = member.email.lower().strip()
-
-        if email_key in self.members_by_email:
+        email_index = self._member_email_index()
+        if member.email_key in email_index:
             raise ValidationError ("Member with this email already exists in the system.")
 
         self.members[member.id] = member
-        self.members_by_email[email_key] = member.id
+        email_index[member.email_key] = member.id
+        if member.is_active:
+            self._active_members.add(member.id)
+        self._invalidate_summary()
 
     def get_member(self, member_id: str) -> Member:
         try:
@@ -75,8 +68,8 @@ class Gym():
             raise NotFoundError (f"Member with '{member_id}' member id not found in the system.")
         
     def find_member_by_email(self, email: str) -> Optional[Member]:
-        email_key = email.lower().strip()
-        member_id = self.members_by_email.get(email_key)
+        email_key = email.strip().lower()
+        member_id = self._member_email_index().get(email_key)
 
         if member_id is None:
             return None
@@ -84,27 +77,37 @@ class Gym():
         return self.members[member_id]
 
     def remove_member(self, member_id: str) -> None:
-        if member_id not in self.members:
+        member = self.members.pop(member_id, None)
+        if member is None:
             raise NotFoundError ("This member does not exist in the system.")
         
-        member = self.members[member_id]
-        email_key = member.email.lower().strip()
-
-        self.members.pop(member_id)
-
-        if self.members_by_email.get(email_key) == member_id:
-            self.members_by_email.pop(email_key)
-
-        else:
-            raise ValidationError ("Inconsistent email index for member.")
+        if self.members_by_email is not None:
+            if __debug__:
+                assert self.members_by_email.get(member.email_key) == member_id, "Inconsistent email index for member."
+            self.members_by_email.pop(member.email_key, None)
+        self._active_members.discard(member_id)
+        self._invalidate_summary()
         
     def cancel_member_membership(self, member_id: str) -> None:
+        """Cancel through the gym so the active member count stays accurate"""
         member = self.get_member(member_id=member_id)
         member.cancel_membership()
+        self._active_members.discard(member.id)
+        self._invalidate_summary()
 
     def pause_membership(self, member_id: str) -> None:
+        """Pause through the gym so the active member count stays accurate"""
         member = self.get_member(member_id=member_id)
         member.pause_membership()
+        self._active_members.discard(member.id)
+        self._invalidate_summary()
+
+    def resume_member_membership(self, member_id: str) -> None:
+        """Resume through the gym so the active member count stays accurate"""
+        member = self.get_member(member_id=member_id)
+        member.resume_membership()
+        self._active_members.add(member.id)
+        self._invalidate_summary()
         
     def list_members(self) -> List[Member]:
         return list(self.members.values())
@@ -125,9 +128,30 @@ class Gym():
         )
 
         self.payment_ledger.add(record)
+        self._invalidate_summary()
         return record
-    
-    def list_all_payments_for_member(self, member_id: str) -> List[PaymentRecord]:
+
+    def charge_all_active_members(self) -> List[PaymentRecord]:
+        charge = self.payment_processor.charge
+        ledger_add = self.payment_ledger.add
+        active = self._active_members
+        records = []
+
+        self._invalidate_summary()
+        for member_id, member in self.members.items():
+            if member_id not in active or not member.is_active:
+                continue
+            record = charge(
+                member_id= member.id,
+                member_name= member.full_name,
+                amount= member.monthly_price
+            )
+            records.append(record)
+            ledger_add(record)
+
+        return records
+
+    def list_all_payments_for_member(self, member_id: str) -> Tuple[PaymentRecord, ...]:
         self.get_member(member_id=member_id)
         return self.payment_ledger.list_all_for_member(member_id=member_id)
     
@@ -167,18 +191,18 @@ class Gym():
         self.workouts.remove_plan(plan_id=plan_id)
 
     def add_trainer(self, trainer: Trainer) -> None:
-        if not isinstance(trainer, Trainer):
+        if __debug__ and not isinstance(trainer, Trainer):
             raise ValidationError ("Must be a trainer object.")
         
         if trainer.id in self.trainers:
             raise ValidationError ("This trainer already exists in the system.")
         
-        email_key = trainer.email.lower().strip()
-
-        if email_key in self.trainers_by_email:
+        email_index = self._trainer_email_index()
+        if trainer.email_key in email_index:
             raise ValidationError ("Trainer with this email already exists in the system.")
         self.trainers[trainer.id] = trainer
-        self.trainers_by_email[email_key] = trainer.id
+        email_index[trainer.email_key] = trainer.id
+        self._invalidate_summary()
 
     def get_trainer(self, trainer_id: str) -> Trainer:
         try:
@@ -187,8 +211,8 @@ class Gym():
             raise NotFoundError ("This trainer does not exist in the system.")
         
     def find_trainer_by_email(self, email: str) -> Optional[Trainer]:
-        email_key = email.lower().strip()
-        trainer_id = self.trainers_by_email.get(email_key)
+        email_key = email.strip().lower()
+        trainer_id = self._trainer_email_index().get(email_key)
 
         if trainer_id is None:
             return None
@@ -196,19 +220,15 @@ class Gym():
         return self.trainers[trainer_id]
     
     def remove_trainer(self, trainer_id: str) -> None:
-        if trainer_id not in self.trainers:
+        trainer = self.trainers.pop(trainer_id, None)
+        if trainer is None:
             raise NotFoundError ("This trainer does not exist in the system.")
         
-        trainer = self.trainers[trainer_id]
-        email_key = trainer.email.lower().strip()
-
-        self.trainers.pop(trainer_id)
-
-        if self.trainers_by_email.get(email_key) == trainer_id:
-            self.trainers_by_email.pop(email_key)
-
-        else:
-            raise ValidationError ("Inconsistent email index for trainer.")
+        if self.trainers_by_email is not None:
+            if __debug__:
+                assert self.trainers_by_email.get(trainer.email_key) == trainer_id, "Inconsistent email index for trainer."
+            self.trainers_by_email.pop(trainer.email_key, None)
+        self._invalidate_summary()
         
     def list_trainers(self) -> List[Trainer]:
         return list(self.trainers.values())
@@ -219,20 +239,22 @@ class Gym():
     def total_trainer_count(self) -> int:
         return len(self.trainers)
     
+    def total_active_members(self) -> int:
+        return len(self._active_members)
+    
     def summary(self) -> str:
-        active_members = sum(1 for m in self.members.values() if m.is_active)
-        inactive_members = self.total_member_count() - active_members
-
-        revenue = self.total_revenue()
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
+        total_members = self.total_member_count()
+        active_members = self.total_active_members()
 
-        return(
-            f"Gym: {self.name}\n",
-            f"Members: {self.total_member_count()}\n",
-            f"{active_members} active, {inactive_members} inactive\n",
-            f"{self.total_trainer_count()} Trainers\n",
-            f"Monthly Revenue: {revenue:.2f}",
+        self._summary_cache = (
+            "Gym: %s\nMembers: %d\n%d active, %d inactive\n%d Trainers\nMonthly Revenue: %.2f"
+            % (self.name, total_members, active_members, total_members - active_members,
+               self.total_trainer_count(), self.total_revenue())
         )
+        return self._summary_cache
     
     def __str__(self):
         return self.summary()
-    
\ No newline at end of file
@@ -1,58 +1,91 @@
 from __future__ import annotations
 
-from gym.gym import new_id, ValidationError, MembershipStatus
-from pricing import PricePolicy, NoDiscount
-from typing import List
+from gym.core import new_id, ValidationError, MembershipStatus
+from gym.pricing import PricePolicy, NoDiscount, FixedPrice
+from typing import List, Optional
 
 from dataclasses import dataclass, field
 from abc import abstractmethod, ABC
 
-@dataclass
+_ACTIVE = MembershipStatus.ACTIVE
+_PAUSED = MembershipStatus.PAUSED
+_CANCELLED = MembershipStatus.CANCELLED
+
+@dataclass(slots=True)
 class BaseMembership(ABC):
     id: str = field(init=False)
 
     status: MembershipStatus = field(init=False)
     price_policy: PricePolicy = field(default_factory= NoDiscount)
 
+    _is_active: bool = field(init=False, default=True, repr=False)
+    _cached_price: Optional[float] = field(init=False, default=None, repr=False)
+    _priced_policy: Optional[PricePolicy] = field(init=False, default=None, repr=False)
+
     def __post_init__(self):
         self.id = new_id("ms")
-        self.status = MembershipStatus.ACTIVE
+        self.status = _ACTIVE
+        self._specialize_price()
+
+    def _specialize_price(self) -> None:
+        policy = self._priced_policy = self.price_policy
+        if type(policy) is NoDiscount:
+            self._cached_price = round(self.base_monthly_price, 2)
+        elif type(policy) is FixedPrice:
+            self._cached_price = round(policy.price, 2)
+        else:
+            self._cached_price = None
 
-    @abstractmethod
     @property
+    @abstractmethod
     def name(self):
         ...
 
-    @abstractmethod
     @property
+    @abstractmethod
     def base_monthly_price(self):
         ...
 
     @property
     def monthly_price(self):
-        return round(self.price_policy.apply(self.base_monthly_price), 2)
+        if self.price_policy is not self._priced_policy:
+            self._specialize_price()
+        if self._cached_price is None:
+            self._cached_price = round(self.price_policy.apply(self.base_monthly_price), 2)
+        return self._cached_price
+    
+    def set_price_policy(self, policy: PricePolicy) -> None:
+        if not isinstance(policy, PricePolicy):
+            raise ValidationError ("Must be a price policy object.")
+        self.price_policy = policy
+        self._specialize_price()
     
     @property
     def is_active(self):
-        return self.status == MembershipStatus.ACTIVE
+        return self._is_active
     
     def pause(self):
-        if self.status == MembershipStatus.CANCELLED:
+        if self.status == _CANCELLED:
             raise ValidationError ("Cannot pause a cancelled membership.")
-        self.status = MembershipStatus.PAUSED
+        self.status = _PAUSED
+        self._is_active = False
 
     def resume(self):
-        if self.status == MembershipStatus.CANCELLED:
+        if self.status == _CANCELLED:
             raise ValidationError ("Cannot resume a cancelled membership.")
-        self.status = MembershipStatus.ACTIVE
+        self.status = _ACTIVE
+        self._is_active = True
 
     def cancel(self):
-        self.status = MembershipStatus.CANCELLED
+        self.status = _CANCELLED
+        self._is_active = False
 
     def benefits(self) -> List[str]:
         return ["24/7 Gym Access", "Pool", "Sauna"]
     
 class BasicMembership(BaseMembership):
+    __slots__ = ()
+
     @property
     def name(self):
         return "Basic"
@@ -62,6 +95,8 @@ class BasicMembership(BaseMembership):
         return 29.99
     
 class PremiumMembership(BaseMembership):
+    __slots__ = ()
+
     @property
     def name(self):
         return "Premium"
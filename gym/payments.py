@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from abc import abstractmethod, ABC
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
+import sys
 
-from gym.gym import new_id, PaymentStatus, ValidationError
+from gym.core import new_id, PaymentStatus, ValidationError
 
-@dataclass(frozen=True, init=False)
+_SUCCESS = PaymentStatus.SUCCESS
+_FAILED = PaymentStatus.FAILED
+
+@dataclass(frozen=True, slots=True)
 class PaymentRecord():
     id: str
     member_id: str
@@ -24,7 +28,8 @@ class PaymentRecord():
                 member_name: str,
                 amount: float,
                 status: PaymentStatus,
-                message: str):
+                message: str,
+                created_at: Optional[datetime] = None):
         if not member_id or not member_id.strip():
             raise ValidationError ("Member id cannot be empty")
         if not member_name or not member_name.strip():
@@ -36,58 +41,118 @@ class PaymentRecord():
         
         return cls(
             id = new_id("pay"),
-            member_id = member_id.strip(),
-            member_name = member_name.strip(),
+            member_id = sys.intern(member_id.strip()),
+            member_name = sys.intern(member_name.strip()),
             amount = amount,
             status = status,
             message= message.strip(),
+            created_at = datetime.now() if created_at is None else created_at
+        )
+
+    @classmethod
+    def _create_trusted(cls,
+                        *,
+                        member_id: str,
+                        member_name: str,
+                        amount: float,
+                        status: PaymentStatus,
+                        message: str):
+        return cls(
+            id = new_id("pay"),
+            member_id = sys.intern(member_id),
+            member_name = sys.intern(member_name),
+            amount = amount,
+            status = status,
+            message = message,
             created_at = datetime.now()
         )
+
+    @classmethod
+    def _from_stored(cls,
+                     *,
+                     id: str,
+                     member_id: str,
+                     member_name: str,
+                     amount: float,
+                     status: PaymentStatus,
+                     message: str,
+                     created_at: datetime):
+        return cls(
+            id = id,
+            member_id = sys.intern(member_id),
+            member_name = sys.intern(member_name),
+            amount = amount,
+            status = status,
+            message = message,
+            created_at = created_at
+        )
     
 class BasePaymentProcessor(ABC):
     @abstractmethod
     def charge(self, *, member_id: str, member_name: str, amount: float) -> PaymentRecord:
         ...
 
+@dataclass
 class FakePaymentProcessor(BasePaymentProcessor):
     fail_threshold: Optional[float] = None
 
+    _SUCCESS_MSG = sys.intern("Payment successfully processed")
+    _FAIL_MSG = sys.intern("Simulated Failure, amount exceeds threshold")
+
     def charge(self, *, member_id, member_name, amount):
         if self.fail_threshold is not None and amount > self.fail_threshold:
-            return PaymentRecord.create(
+            return PaymentRecord._create_trusted(
                 member_id= member_id,
                 member_name= member_name,
                 amount=amount,
-                status= PaymentStatus.FAILED,
-                message="Simulated Failure, amount exceeds threshold"
+                status=_FAILED,
+                message=self._FAIL_MSG
             )
-        return PaymentRecord.create(
+        return PaymentRecord._create_trusted(
             member_id=member_id,
             member_name=member_name,
             amount=amount,
-            status=PaymentStatus.SUCCESS,
-            message="Payment sucessfully processed"
+            status=_SUCCESS,
+            message=self._SUCCESS_MSG
         )
     
-@dataclass
+@dataclass(slots=True)
 class InMemoryPaymentLedger():
     records :List[PaymentRecord] = field(default_factory=list)
 
+    _by_member: Dict[str, List[PaymentRecord]] = field(init=False, repr=False, default_factory=dict)
+    _success_by_member: Dict[str, float] = field(init=False, repr=False, default_factory=dict)
+    _success_total: float = field(init=False, repr=False, default=0.0)
+    _member_list_cache: Dict[str, Tuple[PaymentRecord, ...]] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        existing = self.records
+        self.records = []
+        for record in existing:
+            self.add(record)
+
     def add(self, record: PaymentRecord) -> None:
-        if not isinstance(record, PaymentRecord):
+        if __debug__ and not isinstance(record, PaymentRecord):
             raise ValidationError ("Must be a payment record object.")
         self.records.append(record)
+        self._by_member.setdefault(record.member_id, []).append(record)
+        self._member_list_cache.pop(record.member_id, None)
+
+        if record.status == _SUCCESS:
+            self._success_by_member[record.member_id] = self._success_by_member.get(record.member_id, 0.0) + record.amount
+            self._success_total += record.amount
 
     def list_all(self) -> List[PaymentRecord]:
         return self.records
     
-    def list_all_for_member(self, member_id: str) -> List[PaymentRecord]:
-        return [r for r in self.records if r.member_id == member_id]
+    def list_all_for_member(self, member_id: str) -> Tuple[PaymentRecord, ...]:
+        cached = self._member_list_cache.get(member_id)
+        if cached is None:
+            cached = self._member_list_cache[member_id] = tuple(self._by_member.get(member_id, ()))
+        return cached
     
     def total_success_for_member(self, member_id: str) -> float:
-        return sum(r.amount for r in self.records 
-                   if (r.member_id == member_id and r.status == PaymentStatus.SUCCESS))
+        return self._success_by_member.get(member_id, 0.0)
     
     def total_success_for_all(self) -> float:
-        return sum(r.amount for r in self.records if r.status == PaymentStatus.SUCCESS)
-    
\ No newline at end of file
+        return self._success_total
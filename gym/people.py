@@ -2,19 +2,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
+from typing import ClassVar, Optional
 
-from gym.gym import new_id, ValidationError, MembershipStatus
+from gym.core import new_id, ValidationError, MembershipStatus
 from gym.memberships import BaseMembership
 
-@dataclass
+@dataclass(slots=True)
 class Person:
+    _id_prefix: ClassVar[str] = "per"
+
     id: str = field(init=False)
     full_name: str
     email: str
+    email_key: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.id = new_id("per")
+        self.id = new_id(self._id_prefix)
         if not self.full_name or not self.full_name.strip():
             raise ValidationError ("Name field cannot be empty.")
         self.full_name = self.full_name.strip()
@@ -25,16 +28,18 @@ class Person:
 
         if "@" not in self.email or "." not in self.email:
             raise ValidationError ("Please enter a valid email.")
+        self.email_key = self.email.lower()
 
-@dataclass        
+@dataclass(slots=True)
 class Member(Person):
+    _id_prefix: ClassVar[str] = "mem"
+
     membership: BaseMembership
     join_date: date = field(default_factory=date.today)
 
     def __post_init__(self) -> None:
-        super().__post_init__()
-        self.id = new_id("mem")
-        if not isinstance(self.membership, BaseMembership):
+        Person.__post_init__(self)
+        if __debug__ and not isinstance(self.membership, BaseMembership):
             raise ValidationError ("Must be a Base Membership object.")
         
     @property
@@ -63,13 +68,17 @@ class Member(Person):
     def pause_membership(self) -> None:
         self.membership.pause()
 
-@dataclass    
+    def resume_membership(self) -> None:
+        self.membership.resume()
+
+@dataclass(slots=True)
 class Trainer(Person):
+    _id_prefix: ClassVar[str] = "trn"
+
     specialty: Optional[str] = None
 
     def __post_init__(self) -> None:
-        super().__post_init__()
-        self.id = new_id("trn")
+        Person.__post_init__(self)
 
         if self.specialty is not None:
             if not self.specialty.strip():
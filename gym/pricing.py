@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from gym.gym import ValidationError
+from gym.core import ValidationError
 from abc import ABC, abstractmethod
 
 from dataclasses import dataclass
@@ -1,85 +1,142 @@
 from __future__ import annotations
 
 import json
+import operator
+import os
 from datetime import datetime, date
-from typing import Any, Dict
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option= orjson.OPT_NON_STR_KEYS)
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii= False).encode("utf-8")
+
 from gym.memberships import BaseMembership, PremiumMembership, BasicMembership
 from gym.pricing import NoDiscount, PercentOff, FixedPrice, PricePolicy
-from gym.gym import MembershipStatus, PaymentStatus, ValidationError, Gym
+from gym.core import MembershipStatus, PaymentStatus, ValidationError
+from gym.gym import Gym
 from gym.people import Member, Trainer
 from gym.workouts import Exercise, WorkoutPlan, WorkoutCatalog
-from gym.payments import PaymentRecord, InMemoryPaymentLedger, FakePaymentProcessor
-
-
-def price_policy_to_dict(policy: PricePolicy) -> Dict[str, Any]:
-    if isinstance(policy, NoDiscount):
-        return {"type": "no_discount"}
-    if isinstance(policy, PercentOff):
-        return {"type": "percent_off", "discount": policy.discount}
-    if isinstance(policy, FixedPrice):
-        return {"type": "fixed_price", "price": policy.price}
-    
-    raise ValidationError (f"Unknown policy type: {type(policy).__name__}")
+from gym.payments import PaymentRecord, InMemoryPaymentLedger, BasePaymentProcessor, FakePaymentProcessor
+
+_PAUSED = MembershipStatus.PAUSED
+_CANCELLED = MembershipStatus.CANCELLED
+
+def _entries(data: Any, error: str) -> Iterable[Any]:
+    # Schema v2 stores collections as lists; v1 keyed them by id.
+    if type(data) is list:
+        return data
+    if type(data) is dict:
+        return data.values()
+    raise ValidationError (error)
+
+
+_POLICY_WRITERS = {
+    NoDiscount: lambda p: {"type": "no_discount"},
+    PercentOff: lambda p: {"type": "percent_off", "discount": p.discount},
+    FixedPrice: lambda p: {"type": "fixed_price", "price": p.price},
+}
+
+_POLICY_READERS = {
+    "no_discount": lambda d: NoDiscount(),
+    "percent_off": lambda d: PercentOff(discount=float(d["discount"])),
+    "fixed_price": lambda d: FixedPrice(price=float(d["price"])),
+}
+
+_MEMBERSHIP_WRITERS = {
+    BasicMembership: "basic",
+    PremiumMembership: "premium",
+}
+
+_MEMBERSHIP_READERS = {
+    "basic": BasicMembership,
+    "premium": PremiumMembership,
+}
+
+def price_policy_to_dict(policy: PricePolicy, cache: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    if cache is not None:
+        cached = cache.get(id(policy))
+        if cached is not None:
+            return cached
+    try:
+        writer = _POLICY_WRITERS[type(policy)]
+    except KeyError:
+        raise ValidationError (f"Unknown policy type: {type(policy).__name__}")
+    result = writer(policy)
+    if cache is not None:
+        cache[id(policy)] = result
+    return result
 
 def price_policy_from_dict(data: Dict[str, Any]) -> PricePolicy:
     policy_type = data.get("type")
 
-    if policy_type == "no_discount":
-        return NoDiscount()
-    if policy_type == "percent_off":
-        return PercentOff(discount=float(data["discount"]))
-    if policy_type == "fixed_price":
-        return FixedPrice(price=float(data["price"]))
-    
-    raise ValidationError (f"Unknown policy type: {policy_type}")
+    try:
+        reader = _POLICY_READERS[policy_type]
+    except (KeyError, TypeError):
+        raise ValidationError (f"Unknown policy type: {policy_type}")
+    return reader(data)
 
-def membership_to_dict(membership: BaseMembership) -> Dict[str, Any]:
-    if isinstance(membership, BaseMembership):
-        membership_type = "basic"
-    elif isinstance(membership, PremiumMembership):
-        membership_type = "premium"
-    else:
+def membership_to_dict(membership: BaseMembership, policy_cache: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    try:
+        membership_type = _MEMBERSHIP_WRITERS[type(membership)]
+    except KeyError:
         raise ValidationError (f"Unknown membership type: {type(membership).__name__}")
     
     return {
         "type": membership_type,
         "status": membership.status.value,
-        "price_policy": price_policy_to_dict(membership.price_policy),
+        "price_policy": price_policy_to_dict(membership.price_policy, policy_cache),
     }
 
-def membership_from_dict(data: Dict[str, Any]) -> BaseMembership:
+def membership_from_dict(data: Dict[str, Any], *,
+                         _MStat: Callable[[Any], MembershipStatus] = MembershipStatus,
+                         _readers: Dict[str, Callable[..., BaseMembership]] = _MEMBERSHIP_READERS) -> BaseMembership:
     membership_type = data.get("type")
     status_str = data.get("status")
     policy_data = data.get("price_policy")
 
     policy = price_policy_from_dict(policy_data)
     
-    if membership_type == "basic":
-        membership = BasicMembership(price_policy=policy)
-    elif membership_type == "premium":
-        membership = PremiumMembership(price_policy=policy)
-    else:
+    try:
+        membership_cls = _readers[membership_type]
+    except (KeyError, TypeError):
         raise ValidationError (f"Unknown membership type: {membership_type}")
+    membership = membership_cls(price_policy=policy)
     
-    membership.status = MembershipStatus(status_str)
+    status = _MStat(status_str)
+    if status == _PAUSED:
+        membership.pause()
+    elif status == _CANCELLED:
+        membership.cancel()
     return membership
 
-def member_to_dict(member: Member) -> Dict[str, Any]:
-    if not isinstance(member, Member):
-        raise ValidationError ("Expected member instance.")
-    
-    return{
+def _member_as_dict(member: Member, policy_cache: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    return {
         "id": member.id,
         "full_name": member.full_name,
         "email": member.email,
         "join_date": member.join_date.isoformat(),
-        "membership": membership_to_dict(member.membership)
+        "membership": membership_to_dict(member.membership, policy_cache)
     }
 
+Member.to_dict = _member_as_dict
+
+def member_to_dict(member: Member) -> Dict[str, Any]:
+    if type(member) is not Member:
+        raise ValidationError ("Expected member instance.")
+    
+    return member.to_dict()
+
 def member_from_dict(data: Dict[str, Any]) -> Member:
-    if not isinstance(data, Dict):
+    if type(data) is not dict:
         raise ValidationError ("Member data must be a dictionary.")
     full_name = data.get("full_name")
     email = data.get("email")
@@ -100,10 +157,7 @@ def member_from_dict(data: Dict[str, Any]) -> Member:
         member.id = str(stored_id)
     return member
 
-def trainer_to_dict(trainer: Trainer) -> Dict[str, Any]:
-    if not isinstance(trainer, Trainer):
-        raise ValidationError ("Expected Trainer instance")
-    
+def _trainer_as_dict(trainer: Trainer) -> Dict[str, Any]:
     return {
         "id": trainer.id,
         "full_name": trainer.full_name,
@@ -111,8 +165,16 @@ def trainer_to_dict(trainer: Trainer) -> Dict[str, Any]:
         "specialty": trainer.specialty,
     }
 
+Trainer.to_dict = _trainer_as_dict
+
+def trainer_to_dict(trainer: Trainer) -> Dict[str, Any]:
+    if type(trainer) is not Trainer:
+        raise ValidationError ("Expected Trainer instance")
+    
+    return trainer.to_dict()
+
 def trainer_from_dict(data: Dict[str, Any]) -> Trainer:
-    if not isinstance(data, Dict):
+    if type(data) is not dict:
         raise ValidationError ("Trainer data must be a dictionary.")
     
     full_name = data.get("full_name")
@@ -133,10 +195,7 @@ def trainer_from_dict(data: Dict[str, Any]) -> Trainer:
     
     return trainer
 
-def exercise_to_dict(exercise: Exercise) -> Dict[str, Any]:
-    if not isinstance(exercise, Exercise):
-        raise ValidationError ("exercise instance expected.")
-    
+def _exercise_as_dict(exercise: Exercise) -> Dict[str, Any]:
     return {
         "name": exercise.name,
         "sets": exercise.sets,
@@ -145,93 +204,117 @@ def exercise_to_dict(exercise: Exercise) -> Dict[str, Any]:
         "notes": exercise.notes,
     }
 
-def exercise_from_dict(data: Dict[str, Any]) -> Exercise:
-    if not isinstance(data, dict):
+Exercise.to_dict = _exercise_as_dict
+
+def exercise_to_dict(exercise: Exercise) -> Dict[str, Any]:
+    if type(exercise) is not Exercise:
+        raise ValidationError ("exercise instance expected.")
+    
+    return exercise.to_dict()
+
+def exercise_from_dict(data: Dict[str, Any], *,
+                       _str: Callable[[Any], str] = str,
+                       _int: Callable[[Any], int] = int,
+                       _float: Callable[[Any], float] = float) -> Exercise:
+    if type(data) is not dict:
         raise ValidationError ("Exercise data must be a dictionary.")
     
     name = data.get("name")
-    if not name or not str(name).strip():
+    if not name or not _str(name).strip():
         raise ValidationError ("Exercise name missing.")
     
     return Exercise(
-        name=str(name),
-        sets= int(data.get("sets", 0)),
-        reps= int(data.get("reps", 0)),
-        load= (None if data.get("load") is None else float(data["load"])),
-        notes= (None if data.get("notes") is None else str(data["notes"]))
+        name=_str(name),
+        sets= _int(data.get("sets", 0)),
+        reps= _int(data.get("reps", 0)),
+        load= (None if data.get("load") is None else _float(data["load"])),
+        notes= (None if data.get("notes") is None else _str(data["notes"]))
     )
 
-def workout_plan_to_dict(plan: WorkoutPlan) -> Dict[str, Any]:
-    if not isinstance(plan, WorkoutPlan):
-        raise ValidationError ("Expected a workout plan instance.")
-    
+def _workout_plan_fields(plan: WorkoutPlan) -> Dict[str, Any]:
     return {
         "id": plan.id,
         "member_id": plan.member_id,
         "title": plan.title,
         "created_at": plan.created_at.isoformat(),
-        "exercises": [exercise_to_dict(e) for e in plan.exercises],
     }
 
-def workout_plan_from_dict(data: Dict) -> WorkoutPlan:
-    if not isinstance(data, dict):
+def _workout_plan_as_dict(plan: WorkoutPlan) -> Dict[str, Any]:
+    data = _workout_plan_fields(plan)
+    data["exercises"] = [e.to_dict() for e in plan.exercises]
+    return data
+
+WorkoutPlan.to_dict = _workout_plan_as_dict
+
+def workout_plan_to_dict(plan: WorkoutPlan) -> Dict[str, Any]:
+    if type(plan) is not WorkoutPlan:
+        raise ValidationError ("Expected a workout plan instance.")
+    
+    return plan.to_dict()
+
+def workout_plan_from_dict(data: Dict[str, Any], *,
+                           _fromiso: Callable[[str], datetime] = datetime.fromisoformat,
+                           _str: Callable[[Any], str] = str,
+                           _exercise: Callable[[Dict[str, Any]], Exercise] = exercise_from_dict) -> WorkoutPlan:
+    if type(data) is not dict:
         raise ValidationError ("Workout plan data must be a dictionary.")
     member_id = data.get("member_id")
     title = data.get("title")
 
-    if not member_id or not str(member_id).strip():
+    if not member_id or not _str(member_id).strip():
         raise ValidationError ("WorkoutPlan missing member_id.")
-    if not title or not str(title).strip():
+    if not title or not _str(title).strip():
         raise ValidationError ("WorkoutPlan missing title.")
     
-    plan = WorkoutPlan(member_id=member_id, title=title)
-
-    stored_id = str(data.get("id"))
-    if stored_id:
-        plan.id = stored_id
-
+    stored_id = data.get("id")
     created_at = data.get("created_at")
-    if created_at:
-        plan.created_at = datetime.fromisoformat(str(created_at))
+
+    if stored_id and created_at:
+        plan = WorkoutPlan._from_stored(
+            id= _str(stored_id),
+            member_id= _str(member_id).strip(),
+            title= _str(title).strip(),
+            created_at= _fromiso(_str(created_at))
+        )
+    else:
+        plan = WorkoutPlan(member_id=member_id, title=title)
+        if stored_id:
+            plan.id = _str(stored_id)
+        if created_at:
+            plan.created_at = _fromiso(_str(created_at))
 
     exercise_data = data.get("exercises", [])
     if not isinstance(exercise_data, list):
         raise ValidationError ("WorkoutPlan.exercises must be a list.")
     for ex in exercise_data:
-        plan.add_exercise(exercise_from_dict(ex))
+        plan.add_exercise(_exercise(ex))
 
     return plan
 
 def workout_catalog_to_dict(cat: WorkoutCatalog) -> Dict[str, Any]:
-    if not isinstance(cat, WorkoutCatalog):
+    if type(cat) is not WorkoutCatalog:
         raise ValidationError ("WorkoutCatalog instance expected.")
     
     return {
-        "plans": {pid: workout_plan_to_dict(plan) for pid , plan in cat.plans.items()}
+        "plans": [plan.to_dict() for plan in cat.plans.values()]
     }
 
 def workout_catalog_from_dict(data: Dict[str, Any]) -> WorkoutCatalog:
-    if not isinstance(data, dict):
+    if type(data) is not dict:
         raise ValidationError ("WorkoutCatalog data must be a Dictionary.")
     
     cat = WorkoutCatalog()
 
-    plans_data = data.get("plans", {})
-
-    if not isinstance (plans_data, dict):
-        raise ValidationError ("WorkoutCatalog.plans must be a dictionary.")
+    plans_data = _entries(data.get("plans", []), "WorkoutCatalog.plans must be a list.")
     
-    for _, plan_data in plans_data.items():
+    for plan_data in plans_data:
         plan = workout_plan_from_dict(plan_data)
         cat.plans[plan.id] = plan
         cat.plans_by_member.setdefault(plan.member_id, []).append(plan.id)
 
     return cat
 
-def payment_record_to_dict(record: PaymentRecord) -> Dict[str, Any]:
-    if not isinstance(record, PaymentRecord):
-        raise ValidationError ("PaymentRecord Instance expected.")
-    
+def _payment_record_as_dict(record: PaymentRecord) -> Dict[str, Any]:
     return {
         "id": record.id,
         "member_id": record.member_id,
@@ -242,63 +325,85 @@ def payment_record_to_dict(record: PaymentRecord) -> Dict[str, Any]:
         "created_at": record.created_at.isoformat(),
     }
 
-def payment_record_from_dict(data: Dict[str, Any]) -> PaymentRecord:
-    if not isinstance(data, dict):
+PaymentRecord.to_dict = _payment_record_as_dict
+
+def payment_record_to_dict(record: PaymentRecord) -> Dict[str, Any]:
+    if type(record) is not PaymentRecord:
+        raise ValidationError ("PaymentRecord Instance expected.")
+    
+    return record.to_dict()
+
+_PAYMENT_RECORD_KEYS = ("id", "member_id", "member_name", "amount", "status", "message", "created_at")
+_payment_record_fields = operator.itemgetter(*_PAYMENT_RECORD_KEYS)
+
+def payment_record_from_dict(data: Dict[str, Any], *,
+                             _fields: Callable[[Dict[str, Any]], Any] = _payment_record_fields,
+                             _fromiso: Callable[[str], datetime] = datetime.fromisoformat,
+                             _PStat: Callable[[Any], PaymentStatus] = PaymentStatus,
+                             _float: Callable[[Any], float] = float,
+                             _str: Callable[[Any], str] = str) -> PaymentRecord:
+    if type(data) is not dict:
         raise ValidationError ("PaymentRecord must be a Dictionary.")
     
-    member_id = data.get("member_id")
-    if not member_id or not str(member_id).strip():
+    try:
+        stored_id, member_id, member_name, amount_raw, status_str, message, created_at = _fields(data)
+    except KeyError:
+        stored_id, member_id, member_name, amount_raw, status_str, message, created_at = (
+            data.get(key) for key in _PAYMENT_RECORD_KEYS
+        )
+
+    if not member_id or not _str(member_id).strip():
         raise ValidationError ("PaymentRecord missing member id.")
 
-    member_name = data.get("member_name")
-    if not member_name or not str(member_name).strip():
+    if not member_name or not _str(member_name).strip():
         raise ValidationError ("PaymentRecord missing member_name.")
     
-    amount_raw= data.get("amount")
     try:
-        amount = float(amount_raw)
+        amount = _float(amount_raw)
     except (TypeError, ValueError):
         raise ValidationError ("PaymentRecord amount must be a positive number.")
     if amount < 0:
         raise ValidationError ("PaymentRecord amount must be greater than 0.")
     
-    status_str = data.get("status")
-    if not status_str or not str(status_str).strip():
+    if not status_str or not _str(status_str).strip():
         raise ValidationError ("PaymentRecord missing payment status")
-    status = PaymentStatus(str(status_str))
+    status = _PStat(_str(status_str))
     
-    message = data.get("message")
-    if not message or not str(message).strip():
+    if not message or not _str(message).strip():
         raise ValidationError ("PaymentRecord missing message.")
     
-    record = PaymentRecord.create(
-        member_id= str(member_id).strip(),
-        member_name=str(member_name).strip(),
+    created = _fromiso(_str(created_at)) if created_at else None
+
+    if stored_id:
+        return PaymentRecord._from_stored(
+            id= _str(stored_id),
+            member_id= _str(member_id).strip(),
+            member_name= _str(member_name).strip(),
+            amount= amount,
+            status= status,
+            message= _str(message).strip(),
+            created_at= datetime.now() if created is None else created
+        )
+
+    return PaymentRecord.create(
+        member_id= _str(member_id).strip(),
+        member_name=_str(member_name).strip(),
         amount=amount,
         status= status,
-        message= str(message).strip()
+        message= _str(message).strip(),
+        created_at= created
     )
 
-    stored_id = data.get("id")
-    if stored_id:
-        object.__setattr__(record, "id", str(stored_id))
-
-    created_at = data.get("created_at")
-    if created_at:
-        object.__setattr__(record, "created_at", datetime.fromisoformat(str(created_at)))
-
-    return record
-
 def ledger_to_dict(ledger: InMemoryPaymentLedger) -> Dict[str, Any]:
-    if not isinstance(ledger, InMemoryPaymentLedger):
+    if type(ledger) is not InMemoryPaymentLedger:
         raise ValidationError ("InMemoryPaymentLedger instance expected.")
     
     return {
-        "records": [payment_record_to_dict(r) for r in ledger.records]
+        "records": [r.to_dict() for r in ledger.records]
     }
 
 def ledger_from_dict(data: Dict[str, Any]) -> InMemoryPaymentLedger:
-    if not isinstance(data, dict):
+    if type(data) is not dict:
         raise ValidationError ("InMemoryPaymentLedger data must be a Dictionary.")
     
     records_data = data.get("records", [])
@@ -312,23 +417,28 @@ def ledger_from_dict(data: Dict[str, Any]) -> InMemoryPaymentLedger:
 
     return ledger
 
+def payment_processor_to_dict(processor: BasePaymentProcessor) -> Dict[str, Any]:
+    return {
+        "type": "fake",
+        "fail_threshold": getattr(processor, "fail_threshold", None)
+    }
+
 def gym_to_dict(gym: Gym) -> Dict[str, Any]:
-    if not isinstance(gym, Gym):
+    if type(gym) is not Gym:
         raise ValidationError ("Gym instance expected.")
     
+    policy_cache: Dict[int, Dict[str, Any]] = {}
     return {
         "name": gym.name,
-        "members": {mid: member_to_dict(member) for mid, member in gym.members.items()},
-        "trainers": {tid: trainer_to_dict(trainer) for tid, trainer in gym.trainers.items()},
-        "payment_processor": {
-            "type": "fake",
-            "fail_threshold": getattr(gym.payment_processor, "fail_threshold", None)
-        },
+        "members": [m.to_dict(policy_cache) for m in gym.members.values()],
+        "trainers": [t.to_dict() for t in gym.trainers.values()],
+        "payment_processor": payment_processor_to_dict(gym.payment_processor),
         "workouts": workout_catalog_to_dict(gym.workouts),
         "payment_ledger": ledger_to_dict(gym.payment_ledger),
     }
+
 def gym_from_dict(data: Dict[str, Any]) -> Gym:
-    if not isinstance(data, dict):
+    if type(data) is not dict:
         raise ValidationError ("Gym data must be a dictionary.")
     
     name = data.get("name")
@@ -337,21 +447,13 @@ def gym_from_dict(data: Dict[str, Any]) -> Gym:
     
     gym = Gym(name=name)
     
-    members_data = data.get("members")
-    if not isinstance(members_data, dict):
-        raise ValidationError ("Members data must be a dictionary.")
-    for _, member_data in members_data.items():
-        member = member_from_dict(member_data)
-        gym.members[member.id] = member
-        gym.members_by_email[member.email.lower().strip()] = member.id
-
-    trainers_data = data.get("trainers")
-    if not isinstance(trainers_data, dict):
-        raise ValidationError ("Trainers data must be a dictionary.")
-    for _, trainer_data in trainers_data.items():
-        trainer = trainer_from_dict(trainer_data)
-        gym.trainers[trainer.id] = trainer
-        gym.trainers_by_email[trainer.email.lower().strip()] = trainer.id
+    members_data = _entries(data.get("members"), "Members data must be a list.")
+    new_members = {m.id: m for m in map(member_from_dict, members_data)}
+    gym.members.update(new_members)
+    gym._active_members.update(mid for mid, m in new_members.items() if m.is_active)
+
+    trainers_data = _entries(data.get("trainers"), "Trainers data must be a list.")
+    gym.trainers.update({t.id: t for t in map(trainer_from_dict, trainers_data)})
 
     gym.workouts = workout_catalog_from_dict(data.get("workouts", {}))
     gym.payment_ledger = ledger_from_dict(data.get("payment_ledger", {}))
@@ -367,24 +469,77 @@ def gym_from_dict(data: Dict[str, Any]) -> Gym:
     
     return gym
 
-CURRENT_SCHEMA_VERSION = 1
-
-def save_gym(gym: Gym, filepath: str | Path) -> None:
+CURRENT_SCHEMA_VERSION = 2
+SUPPORTED_SCHEMA_VERSIONS = (1, 2)
+
+def _write_array(f: BinaryIO, values: Iterable[Any], encode: Callable[[Any], bytes]) -> None:
+    write = f.write
+    write(b"[")
+    for i, value in enumerate(values):
+        if i:
+            write(b",")
+        write(encode(value))
+    write(b"]")
+
+def _exercise_to_bytes(exercise: Exercise, cache: Dict[int, bytes]) -> bytes:
+    encoded = cache.get(id(exercise))
+    if encoded is None:
+        encoded = cache[id(exercise)] = _dumps(exercise.to_dict())
+    return encoded
+
+def _workout_plan_to_bytes(plan: WorkoutPlan, cache: Dict[int, bytes]) -> bytes:
+    # the fields dict is never empty, so its encoding always ends in "}" and
+    # the exercises array can be spliced in just before it
+    head = _dumps(_workout_plan_fields(plan))
+    exercises = b",".join([_exercise_to_bytes(e, cache) for e in plan.exercises])
+    return head[:-1] + b',"exercises":[' + exercises + b"]}"
+
+def _stream_gym(gym: Gym, f: BinaryIO) -> None:
+    policy_cache: Dict[int, Dict[str, Any]] = {}
+    exercise_cache: Dict[int, bytes] = {}
+    write = f.write
+
+    write(b'{"schema_version":')
+    write(_dumps(CURRENT_SCHEMA_VERSION))
+    write(b',"gym":{"name":')
+    write(_dumps(gym.name))
+    write(b',"members":')
+    _write_array(f, gym.members.values(), lambda m: _dumps(m.to_dict(policy_cache)))
+    write(b',"trainers":')
+    _write_array(f, gym.trainers.values(), lambda t: _dumps(t.to_dict()))
+    write(b',"payment_processor":')
+    write(_dumps(payment_processor_to_dict(gym.payment_processor)))
+    write(b',"workouts":{"plans":')
+    _write_array(f, gym.workouts.plans.values(), lambda p: _workout_plan_to_bytes(p, exercise_cache))
+    write(b'},"payment_ledger":{"records":')
+    _write_array(f, gym.payment_ledger.records, lambda r: _dumps(r.to_dict()))
+    write(b"}}}")
+
+def save_gym(gym: Gym, filepath: str | Path, tmp_path: str | Path | None = None) -> None:
     if not isinstance(gym, Gym):
         raise ValidationError ("save_gym expects a gym instance.")
     
-    path = Path(filepath)
+    path = filepath if isinstance(filepath, Path) else Path(filepath)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    payload: Dict[str, Any] = {
-        "schema_version": CURRENT_SCHEMA_VERSION,
-        "gym": gym_to_dict(gym)
-    }
-
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-
-    with tmp_path.open("w", encoding= "utf-8") as f:
-        json.dump(payload, f, ensure_ascii= False, indent= 2)
+    if tmp_path is None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+    elif not isinstance(tmp_path, Path):
+        tmp_path = Path(tmp_path)
+
+    if os.environ.get("GYM_PRETTY_JSON") == "1":
+        payload: Dict[str, Any] = {
+            "schema_version": CURRENT_SCHEMA_VERSION,
+            "gym": gym_to_dict(gym)
+        }
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(payload, option= orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with tmp_path.open("w", encoding= "utf-8") as f:
+                json.dump(payload, f, ensure_ascii= False, indent= 2)
+    else:
+        with tmp_path.open("wb") as f:
+            _stream_gym(gym, f)
 
     tmp_path.replace(path)
 
@@ -393,18 +548,21 @@ def load_gym(filepath : str | Path) -> Gym:
     if not path.exists():
         raise ValidationError (f"No save file found at {path}")
     
-    with path.open("r", encoding= "utf-8") as f:
-        payload = json.load(f)
+    if orjson is not None:
+        payload = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding= "utf-8") as f:
+            payload = json.load(f)
 
-    if not isinstance(payload, dict):
+    if type(payload) is not dict:
         raise ValidationError ("Unexpected save file format: expected json instance at root.")
     
     version = payload.get("schema_version")
-    if version != CURRENT_SCHEMA_VERSION:
-        raise ValidationError (f"Unsupported schema version: expected {CURRENT_SCHEMA_VERSION}.")
+    if version not in SUPPORTED_SCHEMA_VERSIONS:
+        raise ValidationError (f"Unsupported schema version: expected one of {SUPPORTED_SCHEMA_VERSIONS}.")
     
     gym_data = payload.get("gym")
-    if not isinstance(gym_data, dict):
+    if type(gym_data) is not dict:
         raise ValidationError ("Invalid save file format: missing 'gym' object.")
     
     return gym_from_dict(gym_data)
\ No newline at end of file
@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict
-from gym.gym import new_id, ValidationError, NotFoundError
+from typing import List, Tuple, Optional, Dict, Sequence
+from gym.core import new_id, ValidationError, NotFoundError
 
 @dataclass(frozen=True)
 class Exercise:
@@ -51,9 +53,19 @@ class WorkoutPlan:
 
         self._exercises = []
 
+    @classmethod
+    def _from_stored(cls, *, id: str, member_id: str, title: str, created_at: datetime) -> WorkoutPlan:
+        plan = cls.__new__(cls)
+        plan.member_id = member_id
+        plan.title = title
+        plan.id = id
+        plan.created_at = created_at
+        plan._exercises = []
+        return plan
+
     @property
-    def exercises(self) -> Tuple[Exercise,...]:
-        return tuple(self._exercises)
+    def exercises(self) -> Sequence[Exercise]:
+        return self._exercises
     
     def list_exercises_numbered(self) -> List[Tuple[int, Exercise]]:
         return list(enumerate(self.exercises, start=1))
@@ -75,9 +87,9 @@ class WorkoutPlan:
         if not name_key:
             raise ValidationError ("Exercise name cannot be empty.")
         
-        for ex in self._exercises:
-            if ex.name.lower().strip() == name_key:
-                self._exercises.remove(ex)
+        for i, ex in enumerate(self._exercises):
+            if ex.name == name_key:
+                del self._exercises[i]
                 return
         
         raise ValidationError ("This exercise does not exist in the plan.")
@@ -108,22 +120,23 @@ class WorkoutCatalog:
         return plan
     
     def list_all_plans_for_member(self, member_id: str) -> List[WorkoutPlan]:
-        plans_ids = self.plans_by_member.get(member_id, [])
-        return [self.plans[pid] for pid in plans_ids if pid in self.plans]
+        return [self.plans[pid] for pid in self.plans_by_member.get(member_id, ())]
     
     def remove_plan(self, plan_id: str) -> None:
-        plan = self.plans.get(plan_id)
+        plan = self.plans.pop(plan_id, None)
         if plan is None:
             raise ValidationError ("This plan does not exist in the system.")
         
         member_id_key = plan.member_id
 
-        self.plans.pop(plan_id)
-
-        plan_ids = self.plans.get(member_id_key)
+        plan_ids = self.plans_by_member.get(member_id_key)
         if plan_ids is None:
             raise ValidationError ("Workout index in consistent: member key missing.")
         
-        if plan_id not in plan_ids:
+        try:
+            plan_ids.remove(plan_id)
+        except ValueError:
             raise ValidationError ("Workout index inconsistent: plan id missing for member.")
-        
\ No newline at end of file
+        
+        if not plan_ids:
+            del self.plans_by_member[member_id_key]
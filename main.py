@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from gym.gym import ValidationError, NotFoundError, Gym
+from gym.core import ValidationError, NotFoundError
+from gym.gym import Gym
 from gym.storage import load_gym, save_gym
 
 from gym.people import Member, Trainer
@@ -11,6 +12,7 @@ from gym.pricing import NoDiscount, PercentOff, FixedPrice
 from gym.workouts import Exercise
 
 SAVE_PATH = Path("data/gym.json")
+SAVE_TMP = SAVE_PATH.with_suffix(".json.tmp")
 
 def prompt(text: str) -> str:
     return input(text).strip()
@@ -69,11 +71,12 @@ def load_or_create_gym() -> Gym:
     name = prompt("Gym name: ")
     gym = Gym(name=name)
     SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    save_gym(gym=gym, filepath=SAVE_PATH)
+    save_gym(gym=gym, filepath=SAVE_PATH, tmp_path=SAVE_TMP)
     return gym
 
 def menu() -> None:
     gym = load_or_create_gym()
+    dirty = False
 
     while True:
         print("\n=================================")
@@ -98,7 +101,7 @@ def menu() -> None:
                 membership = choose_membership()
                 member = Member(full_name=full_name, email=email, membership=membership)
                 gym.add_member(member=member)
-                save_gym(gym=gym, filepath=SAVE_PATH)
+                dirty = True
                 print(f"Member added: {member.full_name} ({member.id})")
 
             elif choice == "2":
@@ -117,7 +120,7 @@ def menu() -> None:
                 except (ValueError):
                     raise ValidationError ("Please enter a valid number.")
                 record = gym.charge_member(member_id=member_id, amount=amount)
-                save_gym(gym, SAVE_PATH)
+                dirty = True
                 print(f"{record.status.value.upper()}: {record.message} (${record.amount:.2f})")
 
             elif choice == "4":
@@ -127,7 +130,7 @@ def menu() -> None:
                 speciality = spec if spec else None
                 trainer = Trainer(full_name=full_name, email=email, specialty=speciality)
                 gym.add_trainer(trainer=trainer)
-                save_gym(gym, SAVE_PATH)
+                dirty = True
                 print(f"Added trainer: {trainer.full_name}, ({trainer.id})")
 
             elif choice == "5":
@@ -143,7 +146,7 @@ def menu() -> None:
                 member_id = prompt("Member_id: ")
                 title = prompt("Plan title: ")
                 plan = gym.create_workout_plan(member_id=member_id, title=title)
-                save_gym(gym, SAVE_PATH)
+                dirty = True
                 print(f"-Plan Created: ({plan.id}) | {plan.title}")
 
             elif choice == "7":
@@ -160,7 +163,7 @@ def menu() -> None:
                 notes_val = None if notes == "" else notes
                 ex = Exercise(name=name, sets=sets, reps=reps, load=load_val, notes=notes_val)
                 gym.add_exercise_to_plan(plan_id=plan_id, exercise=ex)
-                save_gym(gym, SAVE_PATH)
+                dirty = True
                 print(f"Exercise added: {ex.name} | {ex.sets} Sets | {ex.reps} reps")
 
             elif choice == "8":
@@ -176,11 +179,13 @@ def menu() -> None:
                             print(f"{num}. {e.name} | {e.sets}x{e.reps} | load: {load_txt}")
 
             elif choice == "9":
-                save_gym(gym, SAVE_PATH)
+                save_gym(gym, SAVE_PATH, SAVE_TMP)
+                dirty = False
                 print("Saved")
 
             elif choice == "0":
-                save_gym(gym, SAVE_PATH)
+                if dirty:
+                    save_gym(gym, SAVE_PATH, SAVE_TMP)
                 print("Goodbye")
                 return
             